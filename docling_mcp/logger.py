@@ -1,12 +1,23 @@
 """Utility module for logging."""
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 
 def setup_logger() -> logging.Logger:
-    """Setup and return a logger for the entire project."""
+    """Setup and return a logger for the entire project.
+
+    The handlers are only attached on the first call. Records are put on a queue and
+    written to the stream by a background listener thread, so that logging does not
+    block the caller on I/O.
+    """
     # Create logger
     logger = logging.getLogger("docling_mcp")
+    if logger.handlers:
+        return logger
+
     logger.setLevel(logging.INFO)
 
     # Create a handler and set its level to INFO
@@ -19,7 +30,13 @@ def setup_logger() -> logging.Logger:
     )
     handler.setFormatter(formatter)
 
-    # Add the handler to the logger
-    logger.addHandler(handler)
+    # Hand records over to the stream handler in a background thread
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Add the queue handler to the logger
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
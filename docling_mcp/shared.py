@@ -25,6 +25,8 @@ mcp = FastMCP("docling")
 # Define your shared cache here if it's used by multiple tools
 local_document_cache: dict[str, DoclingDocument] = {}
 local_stack_cache: dict[str, list[NodeItem]] = {}
+# Markdown exports are memoized per document and dropped whenever a tool mutates it
+local_markdown_cache: dict[str, tuple[DoclingDocument, str]] = {}
 
 OLLAMA_MODEL: str | None = os.getenv("OLLAMA_MODEL")
 EMBEDDING_MODEL: str | None = os.getenv("EMBEDDING_MODEL")
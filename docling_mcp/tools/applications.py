@@ -1,7 +1,6 @@
 """This module defines applications."""
 
 import os
-from typing import Any
 
 from docling_core.types.doc.document import DoclingDocument
 
@@ -15,8 +14,6 @@ if (
     and os.getenv("OLLAMA_MODEL") != ""
     and os.getenv("EMBEDDING_MODEL") != ""
 ):
-    import json
-
     from llama_index.core import Document, StorageContext, VectorStoreIndex
     from llama_index.core.base.response.schema import (
         RESPONSE_TYPE,
@@ -54,8 +51,10 @@ if (
             )
 
         docling_document: DoclingDocument = local_document_cache[document_key]
-        document_dict: dict[str, Any] = docling_document.export_to_dict()
-        document_json: str = json.dumps(document_dict)
+        # Serialize directly in pydantic-core, same content as export_to_dict()
+        document_json: str = docling_document.model_dump_json(
+            by_alias=True, exclude_none=True
+        )
 
         document = Document(
             text=document_json,
@@ -23,7 +23,12 @@ from docling_core.types.doc.labels import (
 
 from docling_mcp.docling_cache import get_cache_key
 from docling_mcp.logger import setup_logger
-from docling_mcp.shared import local_document_cache, local_stack_cache, mcp
+from docling_mcp.shared import (
+    local_document_cache,
+    local_markdown_cache,
+    local_stack_cache,
+    mcp,
+)
 
 # Create a default project logger
 logger = setup_logger()
@@ -158,6 +163,7 @@ def convert_pdf_document_into_docling_document(
         )
 
         local_stack_cache[cache_key] = [item]
+        local_markdown_cache.pop(cache_key, None)
 
         # Log completion
         logger.info(f"Successfully created the Docling document: {source}")
@@ -3,7 +3,7 @@
 import hashlib
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Annotated
+from typing import Annotated, Literal
 
 from pydantic import Field
 
@@ -17,6 +17,7 @@ from docling_core.types.doc.document import (
     DoclingDocument,
     GroupItem,
     LevelNumber,
+    NodeItem,
 )
 from docling_core.types.doc.labels import (
     DocItemLabel,
@@ -26,15 +27,23 @@ from docling_core.types.io import DocumentStream
 
 from docling_mcp.docling_cache import get_cache_dir
 from docling_mcp.logger import setup_logger
-from docling_mcp.shared import local_document_cache, local_stack_cache, mcp
+from docling_mcp.shared import (
+    local_document_cache,
+    local_markdown_cache,
+    local_stack_cache,
+    mcp,
+)
 
 # Create a default project logger
 logger = setup_logger()
 
+# Converter for HTML tables, shared across calls so that its pipeline is reused
+html_table_converter = DocumentConverter(allowed_formats=[InputFormat.HTML])
+
 
-def hash_string_md5(input_string: str) -> str:
-    """Creates an md5 hash-string from the input string."""
-    return hashlib.md5(input_string.encode()).hexdigest()
+def hash_string_blake2b(input_string: str) -> str:
+    """Creates a 32 character BLAKE2b hash-string from the input string."""
+    return hashlib.blake2b(input_string.encode(), digest_size=16).hexdigest()
 
 
 @dataclass
@@ -56,8 +65,8 @@ def create_new_docling_document(
     """Create a new Docling document from a provided prompt string.
 
     This function generates a new document in the local document cache with the
-    provided prompt text. The document is assigned a unique key derived from an MD5
-    hash of the prompt text.
+    provided prompt text. The document is assigned a unique key derived from a
+    BLAKE2b hash of the prompt text.
     """
     doc = DoclingDocument(name="Generated Document")
 
@@ -67,10 +76,11 @@ def create_new_docling_document(
         content_layer=ContentLayer.FURNITURE,
     )
 
-    document_key = hash_string_md5(prompt)
+    document_key = hash_string_blake2b(prompt)
 
     local_document_cache[document_key] = doc
     local_stack_cache[document_key] = [item]
+    local_markdown_cache.pop(document_key, None)
 
     return NewDoclingDocumentOutput(document_key, prompt)
 
@@ -106,7 +116,15 @@ def export_docling_document_to_markdown(
             f"document-key: {document_key} is not found. Existing document-keys are: {doc_keys}"
         )
 
-    markdown = local_document_cache[document_key].export_to_markdown()
+    doc = local_document_cache[document_key]
+
+    # Reuse the previous export unless the document was replaced or modified since
+    cached = local_markdown_cache.get(document_key)
+    if cached is not None and cached[0] is doc:
+        markdown = cached[1]
+    else:
+        markdown = doc.export_to_markdown()
+        local_markdown_cache[document_key] = (doc, markdown)
 
     return ExportDocumentMarkdownOutput(document_key, markdown)
 
@@ -168,6 +186,38 @@ class UpdateDocumentOutput:
     ]
 
 
+def is_list_group(item: NodeItem) -> bool:
+    """Whether the stack item is an opened list group."""
+    return isinstance(item, GroupItem) and (
+        item.label == GroupLabel.LIST or item.label == GroupLabel.ORDERED_LIST
+    )
+
+
+def check_list_state(content: str, list_opened: bool) -> None:
+    """Check that the content can be added given whether a list is opened.
+
+    List items can only be added to an opened list, while any other content requires
+    that no list is opened.
+    """
+    if content == "list-items":
+        if not list_opened:
+            raise ValueError(
+                "No list is currently opened. Please open a list before adding list-items!"
+            )
+    elif list_opened:
+        raise ValueError(
+            f"A list is currently opened. Please close the list before adding a {content}!"
+        )
+
+
+def check_list_can_be_closed(document_key: str, stack_size: int) -> None:
+    """Check that the document stack holds a list that can be closed."""
+    if stack_size <= 1:
+        raise ValueError(
+            f"Stack size is zero for document with document-key: {document_key}. Abort document generation"
+        )
+
+
 @mcp.tool(title="Add or update title to Docling document")
 def add_title_to_docling_document(
     document_key: Annotated[
@@ -195,16 +245,11 @@ def add_title_to_docling_document(
             f"Stack size is zero for document with document-key: {document_key}. Abort document generation"
         )
 
-    parent = local_stack_cache[document_key][-1]
-
-    if isinstance(parent, GroupItem):
-        if parent.label == GroupLabel.LIST or parent.label == GroupLabel.ORDERED_LIST:
-            raise ValueError(
-                "A list is currently opened. Please close the list before adding a title!"
-            )
+    check_list_state("title", is_list_group(local_stack_cache[document_key][-1]))
 
     item = local_document_cache[document_key].add_title(text=title)
     local_stack_cache[document_key][-1] = item
+    local_markdown_cache.pop(document_key, None)
 
     return UpdateDocumentOutput(document_key)
 
@@ -242,18 +287,15 @@ def add_section_heading_to_docling_document(
             f"Stack size is zero for document with document-key: {document_key}. Abort document generation"
         )
 
-    parent = local_stack_cache[document_key][-1]
-
-    if isinstance(parent, GroupItem):
-        if parent.label == GroupLabel.LIST or parent.label == GroupLabel.ORDERED_LIST:
-            raise ValueError(
-                "A list is currently opened. Please close the list before adding a section-heading!"
-            )
+    check_list_state(
+        "section-heading", is_list_group(local_stack_cache[document_key][-1])
+    )
 
     item = local_document_cache[document_key].add_heading(
         text=section_heading, level=section_level
     )
     local_stack_cache[document_key][-1] = item
+    local_markdown_cache.pop(document_key, None)
 
     return UpdateDocumentOutput(document_key)
 
@@ -284,18 +326,13 @@ def add_paragraph_to_docling_document(
             f"Stack size is zero for document with document-key: {document_key}. Abort document generation"
         )
 
-    parent = local_stack_cache[document_key][-1]
-
-    if isinstance(parent, GroupItem):
-        if parent.label == GroupLabel.LIST or parent.label == GroupLabel.ORDERED_LIST:
-            raise ValueError(
-                "A list is currently opened. Please close the list before adding a paragraph!"
-            )
+    check_list_state("paragraph", is_list_group(local_stack_cache[document_key][-1]))
 
     item = local_document_cache[document_key].add_text(
         label=DocItemLabel.TEXT, text=paragraph
     )
     local_stack_cache[document_key][-1] = item
+    local_markdown_cache.pop(document_key, None)
 
     return UpdateDocumentOutput(document_key)
 
@@ -326,6 +363,7 @@ def open_list_in_docling_document(
 
     item = local_document_cache[document_key].add_group(label=GroupLabel.LIST)
     local_stack_cache[document_key].append(item)
+    local_markdown_cache.pop(document_key, None)
 
     return UpdateDocumentOutput(document_key)
 
@@ -349,10 +387,7 @@ def close_list_in_docling_document(
             f"document-key: {document_key} is not found. Existing document-keys are: {doc_keys}"
         )
 
-    if len(local_stack_cache[document_key]) <= 1:
-        raise ValueError(
-            f"Stack size is zero for document with document-key: {document_key}. Abort document generation"
-        )
+    check_list_can_be_closed(document_key, len(local_stack_cache[document_key]))
 
     local_stack_cache[document_key].pop()
 
@@ -397,15 +432,7 @@ def add_list_items_to_list_in_docling_document(
 
     parent = local_stack_cache[document_key][-1]
 
-    if isinstance(parent, GroupItem):
-        if parent.label != GroupLabel.LIST and parent.label != GroupLabel.ORDERED_LIST:
-            raise ValueError(
-                "No list is currently opened. Please open a list before adding list-items!"
-            )
-    else:
-        raise ValueError(
-            "No list is currently opened. Please open a list before adding list-items!"
-        )
+    check_list_state("list-items", is_list_group(parent))
 
     for list_item in list_items:
         local_document_cache[document_key].add_list_item(
@@ -414,6 +441,8 @@ def add_list_items_to_list_in_docling_document(
             parent=parent,
         )
 
+    local_markdown_cache.pop(document_key, None)
+
     return UpdateDocumentOutput(document_key)
 
 
@@ -461,13 +490,16 @@ def add_table_in_html_format_to_docling_document(
             f"Stack size is zero for document with document-key: {document_key}. Abort document generation"
         )
 
-    html_doc: str = f"<html><body>{html_table}</body></html>"
+    # Wrap the table in an HTML page, unless it already is one (only inspect the head)
+    if html_table[:64].lstrip()[:9].lower().startswith(("<html", "<!doctype")):
+        html_doc = html_table
+    else:
+        html_doc = f"<html><body>{html_table}</body></html>"
 
     buff = BytesIO(html_doc.encode("utf-8"))
     doc_stream = DocumentStream(name="tmp", stream=buff)
 
-    converter = DocumentConverter(allowed_formats=[InputFormat.HTML])
-    conv_result: ConversionResult = converter.convert(doc_stream)
+    conv_result: ConversionResult = html_table_converter.convert(doc_stream)
 
     if (
         conv_result.status == ConversionStatus.SUCCESS
@@ -487,4 +519,137 @@ def add_table_in_html_format_to_docling_document(
             "Could not parse the html string of the table! Please fix the html and try again!"
         )
 
+    local_markdown_cache.pop(document_key, None)
+
+    return UpdateDocumentOutput(document_key)
+
+
+@dataclass
+class ContentItem:
+    """A class to represent a content item to add to a document."""
+
+    content_type: Annotated[
+        Literal["section_heading", "paragraph", "open_list", "list_item", "close_list"],
+        Field(
+            description=(
+                "The type of content to add to the document. Use open_list and "
+                "close_list around a run of list_item entries."
+            )
+        ),
+    ]
+    text: Annotated[
+        str,
+        Field(
+            description=(
+                "The text of a section heading, paragraph or list item. Ignored for "
+                "open_list and close_list."
+            )
+        ),
+    ] = ""
+    section_level: Annotated[
+        LevelNumber,
+        Field(
+            description=(
+                "The level of a section heading, starting from 1, where 1 is the "
+                "highest level. Ignored for other content types."
+            )
+        ),
+    ] = 1
+    list_marker_text: Annotated[
+        str,
+        Field(
+            description="The marker of a list item. Ignored for other content types."
+        ),
+    ] = "-"
+
+
+@mcp.tool(title="Add batch of content items to Docling document")
+def add_content_batch_to_docling_document(
+    document_key: Annotated[
+        str,
+        Field(description="The unique identifier of the document in the local cache."),
+    ],
+    content_items: Annotated[
+        list[ContentItem],
+        Field(
+            description=(
+                "An ordered list of section headings, paragraphs, list openings, list "
+                "items and list closings to add."
+            )
+        ),
+    ],
+) -> UpdateDocumentOutput:
+    """Add a sequence of section headings, paragraphs and lists in a single call.
+
+    This tool appends the content items in order to a document in the local cache,
+    following the same rules as the individual tools: list items require an open list,
+    while section headings and paragraphs require that no list is open, and section
+    headings, paragraphs and list items require a non-empty text. The whole
+    batch is checked before the document is modified, so if any item is rejected,
+    none of the items are added.
+    """
+    if document_key not in local_document_cache:
+        doc_keys = ", ".join(local_document_cache.keys())
+        raise ValueError(
+            f"document-key: {document_key} is not found. Existing document-keys are: {doc_keys}"
+        )
+
+    if len(local_stack_cache[document_key]) == 0:
+        raise ValueError(
+            f"Stack size is zero for document with document-key: {document_key}. Abort document generation"
+        )
+
+    # Replay the batch on the list state of the stack before modifying the document
+    list_opened = [is_list_group(item) for item in local_stack_cache[document_key]]
+    for index, content_item in enumerate(content_items):
+        try:
+            needs_text = content_item.content_type not in ("open_list", "close_list")
+            if needs_text and not content_item.text:
+                raise ValueError(
+                    f"The text of a {content_item.content_type.replace('_', '-')} must not be empty!"
+                )
+
+            if content_item.content_type == "open_list":
+                list_opened.append(True)
+            elif content_item.content_type == "close_list":
+                check_list_can_be_closed(document_key, len(list_opened))
+                list_opened.pop()
+            elif content_item.content_type == "list_item":
+                check_list_state("list-items", list_opened[-1])
+            else:
+                check_list_state(
+                    content_item.content_type.replace("_", "-"), list_opened[-1]
+                )
+        except ValueError as e:
+            raise ValueError(
+                f"Content item {index} ({content_item.content_type}) was rejected: {e} "
+                "No content items were added."
+            ) from e
+
+    for content_item in content_items:
+        if content_item.content_type == "section_heading":
+            add_section_heading_to_docling_document(
+                document_key=document_key,
+                section_heading=content_item.text,
+                section_level=content_item.section_level,
+            )
+        elif content_item.content_type == "paragraph":
+            add_paragraph_to_docling_document(
+                document_key=document_key, paragraph=content_item.text
+            )
+        elif content_item.content_type == "open_list":
+            open_list_in_docling_document(document_key=document_key)
+        elif content_item.content_type == "close_list":
+            close_list_in_docling_document(document_key=document_key)
+        else:
+            add_list_items_to_list_in_docling_document(
+                document_key=document_key,
+                list_items=[
+                    ListItem(
+                        list_item_text=content_item.text,
+                        list_marker_text=content_item.list_marker_text,
+                    )
+                ],
+            )
+
     return UpdateDocumentOutput(document_key)
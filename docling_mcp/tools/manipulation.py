@@ -16,7 +16,7 @@ from docling_core.types.doc.document import (
 )
 
 from docling_mcp.logger import setup_logger
-from docling_mcp.shared import local_document_cache, mcp
+from docling_mcp.shared import local_document_cache, local_markdown_cache, mcp
 
 # Create a default project logger
 logger = setup_logger()
@@ -281,6 +281,7 @@ def update_text_of_document_item_at_anchor(
 
     if isinstance(item, TextItem):
         item.text = updated_text
+        local_markdown_cache.pop(document_key, None)
     else:
         raise ValueError(
             f"Item at {document_anchor} for document-key: {document_key} is not a "
@@ -327,5 +328,6 @@ def delete_document_items_at_anchors(
         items.append(ref.resolve(doc=doc))
 
     doc.delete_items(node_items=items)
+    local_markdown_cache.pop(document_key, None)
 
     return True
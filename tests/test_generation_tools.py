@@ -2,13 +2,25 @@ import re
 
 import pytest
 
+from docling_core.types.doc.document import DoclingDocument
+from docling_core.types.doc.labels import DocItemLabel
+
 from docling_mcp.logger import setup_logger
-from docling_mcp.shared import local_document_cache
+from docling_mcp.shared import local_document_cache, local_markdown_cache
 from docling_mcp.tools.generation import (
+    ContentItem,
+    ExportDocumentMarkdownOutput,
     NewDoclingDocumentOutput,
     UpdateDocumentOutput,
+    add_content_batch_to_docling_document,
+    add_paragraph_to_docling_document,
     add_table_in_html_format_to_docling_document,
     create_new_docling_document,
+    export_docling_document_to_markdown,
+)
+from docling_mcp.tools.manipulation import (
+    delete_document_items_at_anchors,
+    update_text_of_document_item_at_anchor,
 )
 
 logger = setup_logger()
@@ -43,3 +55,153 @@ def test_table_in_html_format_to_docling_document(doc_key: str) -> None:
 
     assert isinstance(reply, UpdateDocumentOutput)
     assert reply.document_key == doc_key
+
+    # a table already wrapped in an HTML page is accepted as is
+    reply = add_table_in_html_format_to_docling_document(
+        document_key=doc_key,
+        html_table=f"<html><body>{html_table}</body></html>",
+    )
+
+    assert isinstance(reply, UpdateDocumentOutput)
+    assert len(local_document_cache[doc_key].tables) == 2
+
+    reply = add_table_in_html_format_to_docling_document(
+        document_key=doc_key,
+        html_table=f"\n  <!DOCTYPE html><html><body>{html_table}</body></html>",
+    )
+
+    assert isinstance(reply, UpdateDocumentOutput)
+    assert len(local_document_cache[doc_key].tables) == 3
+
+
+def test_export_docling_document_to_markdown(doc_key: str) -> None:
+    add_paragraph_to_docling_document(
+        document_key=doc_key, paragraph="First paragraph."
+    )
+
+    reply = export_docling_document_to_markdown(document_key=doc_key)
+    assert isinstance(reply, ExportDocumentMarkdownOutput)
+    assert "First paragraph." in reply.markdown
+    assert local_markdown_cache[doc_key][1] is reply.markdown
+
+    # a repeated export is served from the markdown cache
+    cached = export_docling_document_to_markdown(document_key=doc_key)
+    assert cached.markdown is reply.markdown
+
+    # mutating the document invalidates the cached export
+    add_paragraph_to_docling_document(
+        document_key=doc_key, paragraph="Second paragraph."
+    )
+    assert doc_key not in local_markdown_cache
+    reply = export_docling_document_to_markdown(document_key=doc_key)
+    assert "First paragraph." in reply.markdown
+    assert "Second paragraph." in reply.markdown
+
+    # so does updating the text of an item...
+    update_text_of_document_item_at_anchor(
+        document_key=doc_key,
+        document_anchor="#/texts/1",
+        updated_text="Updated paragraph.",
+    )
+    assert doc_key not in local_markdown_cache
+    reply = export_docling_document_to_markdown(document_key=doc_key)
+    assert "First paragraph." not in reply.markdown
+    assert "Updated paragraph." in reply.markdown
+
+    # ...and deleting items
+    delete_document_items_at_anchors(
+        document_key=doc_key, document_anchors=["#/texts/2"]
+    )
+    assert doc_key not in local_markdown_cache
+    reply = export_docling_document_to_markdown(document_key=doc_key)
+    assert "Updated paragraph." in reply.markdown
+    assert "Second paragraph." not in reply.markdown
+
+    # a document replaced under the same key drops the cached export
+    create_new_docling_document(prompt="test-document")
+    assert doc_key not in local_markdown_cache
+    reply = export_docling_document_to_markdown(document_key=doc_key)
+    assert "Updated paragraph." not in reply.markdown
+    assert local_markdown_cache[doc_key][0] is local_document_cache[doc_key]
+
+    # a document assigned to the cache directly is not served a stale export
+    local_document_cache[doc_key] = DoclingDocument(name="Replaced Document")
+    local_document_cache[doc_key].add_text(label=DocItemLabel.TEXT, text="Replaced.")
+    reply = export_docling_document_to_markdown(document_key=doc_key)
+    assert "Replaced." in reply.markdown
+
+
+def test_add_content_batch_to_docling_document(doc_key: str) -> None:
+    reply = add_content_batch_to_docling_document(
+        document_key=doc_key,
+        content_items=[
+            ContentItem(content_type="section_heading", text="Introduction"),
+            ContentItem(content_type="paragraph", text="Some introductory text."),
+            ContentItem(content_type="open_list"),
+            ContentItem(content_type="list_item", text="first item"),
+            ContentItem(content_type="list_item", text="second item"),
+            ContentItem(content_type="close_list"),
+            ContentItem(content_type="paragraph", text="Some closing text."),
+        ],
+    )
+    assert isinstance(reply, UpdateDocumentOutput)
+    assert reply.document_key == doc_key
+
+    markdown = export_docling_document_to_markdown(document_key=doc_key).markdown
+    assert "Introduction" in markdown
+    assert "Some introductory text." in markdown
+    assert "- first item" in markdown
+    assert "- second item" in markdown
+    assert "Some closing text." in markdown
+
+    # a rejected batch leaves the document untouched
+    num_texts = len(local_document_cache[doc_key].texts)
+    num_groups = len(local_document_cache[doc_key].groups)
+    with pytest.raises(ValueError, match=r"Content item 1 \(list_item\)"):
+        add_content_batch_to_docling_document(
+            document_key=doc_key,
+            content_items=[
+                ContentItem(content_type="paragraph", text="A"),
+                ContentItem(content_type="list_item", text="B"),
+            ],
+        )
+    assert len(local_document_cache[doc_key].texts) == num_texts
+
+    # content items without text are rejected as well
+    with pytest.raises(ValueError, match=r"Content item 1 \(section_heading\)"):
+        add_content_batch_to_docling_document(
+            document_key=doc_key,
+            content_items=[
+                ContentItem(content_type="paragraph", text="A"),
+                ContentItem(content_type="section_heading"),
+            ],
+        )
+    with pytest.raises(ValueError, match=r"Content item 1 \(list_item\)"):
+        add_content_batch_to_docling_document(
+            document_key=doc_key,
+            content_items=[
+                ContentItem(content_type="open_list"),
+                ContentItem(content_type="list_item"),
+                ContentItem(content_type="close_list"),
+            ],
+        )
+    with pytest.raises(ValueError, match=r"Content item 0 \(paragraph\)"):
+        add_content_batch_to_docling_document(
+            document_key=doc_key,
+            content_items=[ContentItem(content_type="paragraph")],
+        )
+    assert len(local_document_cache[doc_key].texts) == num_texts
+    assert len(local_document_cache[doc_key].groups) == num_groups
+
+    with pytest.raises(ValueError, match=r"Content item 0 \(close_list\)"):
+        add_content_batch_to_docling_document(
+            document_key=doc_key,
+            content_items=[ContentItem(content_type="close_list")],
+        )
+
+
+def test_add_content_batch_to_unknown_docling_document() -> None:
+    with pytest.raises(ValueError, match="is not found"):
+        add_content_batch_to_docling_document(
+            document_key="does-not-exist", content_items=[]
+        )